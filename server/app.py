@@ -1,111 +1,380 @@
-from flask import Flask, request, jsonify, make_response
-import ssl
-from langchain_community.llms import Ollama
+from flask import Flask, request, jsonify, Response, stream_with_context
+from flask.json.provider import JSONProvider
+from langchain_community.chat_models import ChatOllama
+from langchain_core.messages import SystemMessage, HumanMessage
 from flask_cors import CORS
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
 import time
 import argparse
 
-# SSL context for HTTPS requests
-ssl._create_default_https_context = ssl._create_unverified_context
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
-# Enable CORS with more permissive settings
-CORS(app, resources={r"/*": {"origins": "*", "allow_headers": "*", "methods": "*"}})
 
-# Add CORS headers to all responses
-@app.after_request
-def add_cors_headers(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
-    return response
+# JSON provider backed by orjson, which encodes and decodes several times
+# faster than the stdlib json module - worth it for large email payloads
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+# Enable CORS with more permissive settings
+CORS(app, resources={r"/*": {
+    "origins": "*",
+    "allow_headers": ["Content-Type", "Authorization"],
+    "methods": ["GET", "PUT", "POST", "DELETE", "OPTIONS"],
+}}, max_age=86400)
 
-# Handle OPTIONS requests for all routes
+# Handle OPTIONS requests for all routes with an empty 204 - preflights
+# only need the CORS headers, which flask_cors injects, and max_age above
+# lets browsers cache the result instead of re-preflighting every call.
 @app.route('/', defaults={'path': ''}, methods=['OPTIONS'])
 @app.route('/<path:path>', methods=['OPTIONS'])
 def handle_options(path):
-    response = make_response(jsonify({'status': 'ok'}))
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
-    return response
+    return ("", 204)
+
+# Build a JSON error response directly. Error paths fire on every request
+# while Ollama is down, so they skip jsonify's dict/Response construction.
+def err(message, status):
+    if orjson is not None:
+        body = b'{"error":' + orjson.dumps(message) + b'}'
+    else:
+        body = json.dumps({'error': message})
+    return Response(body, status=status, mimetype='application/json')
 
 # Handle 404 errors
 @app.errorhandler(404)
 def not_found(e):
-    return jsonify(error=str(e)), 404
+    return err(str(e), 404)
 
 # Handle 403 errors
 @app.errorhandler(403)
 def forbidden(e):
-    return jsonify(error=str(e)), 403
+    return err(str(e), 403)
 
 # Handle 500 errors
 @app.errorhandler(500)
 def server_error(e):
-    return jsonify(error=str(e)), 500
+    return err(str(e), 500)
 
-# Check if Ollama is running
-def check_ollama():
+# Shared HTTP session for Ollama probes so repeated checks reuse the
+# same TCP connection instead of re-handshaking every time
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# How long to reuse a check_ollama() result before probing again (seconds)
+OLLAMA_CHECK_TTL = float(os.environ.get('OLLAMA_CHECK_TTL', '5'))
+
+# Model used when the request doesn't name one. Point SUMMARY_MODEL at a
+# quantized variant (e.g. llama3.2:1b-instruct-q4_K_M) for faster
+# generation at lower memory bandwidth.
+DEFAULT_MODEL = os.environ.get('SUMMARY_MODEL', 'llama3.2:1b')
+
+# Cached result of the last Ollama probe
+_ollama_cache = {"t": 0.0, "val": (False, None)}
+_ollama_cache_lock = threading.Lock()
+
+# Probe Ollama directly (no caching)
+def _probe_ollama():
     """
-    Check if Ollama is running and the Llama 3.2 1B model is available.
-    
+    Check if Ollama is running and the configured model is available.
+
     Returns:
         tuple: (is_running, error_message)
     """
     try:
-        response = requests.get("http://localhost:11434/api/tags")
+        # /api/show returns a small fixed-size body, unlike /api/tags whose
+        # response grows with every model installed
+        response = SESSION.post("http://localhost:11434/api/show", json={"name": DEFAULT_MODEL}, timeout=2)
         if response.status_code == 200:
-            models = response.json().get("models", [])
-            llama3_models = [model for model in models if "llama3.2:1b" in model.get("name", "").lower()]
-            
-            if llama3_models:
-                return True, None
-            else:
-                return False, "Llama 3.2 1B model is not available. Please run 'ollama pull llama3.2:1b'"
+            return True, None
+        elif response.status_code == 404:
+            return False, f"The {DEFAULT_MODEL} model is not available. Please run 'ollama pull {DEFAULT_MODEL}'"
         else:
             return False, f"Ollama returned status code {response.status_code}"
+    except requests.exceptions.Timeout:
+        return False, "Ollama did not respond in time. It may be busy or still starting up"
     except requests.exceptions.ConnectionError:
         return False, "Cannot connect to Ollama. Please make sure Ollama is running"
     except Exception as e:
         return False, f"Error checking Ollama: {str(e)}"
 
-# Check Ollama status at startup
-ollama_running, ollama_error = check_ollama()
+# Background loop keeping the Ollama status cache fresh
+def _refresh_ollama_loop():
+    """
+    Re-probe Ollama every OLLAMA_CHECK_TTL seconds so request handlers can
+    read the cached status without ever blocking on a probe themselves.
+    """
+    while True:
+        time.sleep(OLLAMA_CHECK_TTL)
+        val = _probe_ollama()
+        with _ollama_cache_lock:
+            _ollama_cache["val"] = val
+            _ollama_cache["t"] = time.monotonic()
+
+_ollama_refresher_started = False
+
+# Check if Ollama is running (cached)
+def check_ollama():
+    """
+    Check if Ollama is running, from a cache kept fresh by a background
+    refresher thread. The first call probes synchronously (bounded by the
+    probe timeout) and starts the refresher; later calls never block, so
+    handler latency is independent of Ollama liveness.
+
+    Returns:
+        tuple: (is_running, error_message)
+    """
+    global _ollama_refresher_started
+    with _ollama_cache_lock:
+        if not _ollama_refresher_started:
+            _ollama_refresher_started = True
+            _ollama_cache["val"] = _probe_ollama()
+            _ollama_cache["t"] = time.monotonic()
+            threading.Thread(target=_refresh_ollama_loop, daemon=True).start()
+        return _ollama_cache["val"]
+
+# On-disk cache of LLM responses keyed by prompt hash
+LLM_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'llm_cache.json')
+_llm_cache_lock = threading.Lock()
+
+def _load_llm_cache():
+    """
+    Load the LLM response cache from disk, returning an empty cache if the
+    file is missing or unreadable.
+    """
+    try:
+        with open(LLM_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+_llm_cache = _load_llm_cache()
+
+# Look up a cached LLM response
+def llm_cache_get(model_name, prompt):
+    """
+    Look up a previously generated response for this model/prompt pair.
+
+    Returns:
+        tuple: (cache_key, cached_response_or_None)
+    """
+    key = hashlib.sha256(f"{model_name}\n{prompt}".encode()).hexdigest()
+    with _llm_cache_lock:
+        if key not in _llm_cache:
+            # Another worker may have cached this since we loaded the file;
+            # a re-read is cheap next to the inference a hit avoids
+            _llm_cache.update(_load_llm_cache())
+        return key, _llm_cache.get(key)
+
+# Store an LLM response in the cache
+def llm_cache_put(key, value):
+    """
+    Store a generated response under the given cache key and persist the
+    cache to disk (best-effort). The on-disk cache is re-read and merged
+    before writing so concurrent workers don't clobber each other's entries.
+    """
+    with _llm_cache_lock:
+        _llm_cache.update(_load_llm_cache())
+        _llm_cache[key] = value
+        try:
+            os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+            with open(LLM_CACHE_PATH, 'w') as f:
+                json.dump(_llm_cache, f)
+        except OSError:
+            pass
+
+# One Ollama chat client per model name, shared across requests
+_llm_pool = {}
+_llm_pool_lock = threading.Lock()
+
+# Get a shared LLM client for a model
+def get_llm(model_name):
+    """
+    Return a shared Ollama chat client for the given model, creating it on
+    first use. Reusing one client per model avoids re-constructing the HTTP
+    client on every request.
+    """
+    with _llm_pool_lock:
+        llm = _llm_pool.get(model_name)
+        if llm is None:
+            llm = _llm_pool[model_name] = ChatOllama(model=model_name)
+        return llm
+
+# Cap on how much email text is sent to the model (characters)
+MAX_EMAIL_CHARS = int(os.environ.get('MAX_EMAIL_CHARS', '8000'))
+
+# Truncate oversized email content before prompting
+def truncate_email_content(email_content):
+    """
+    Cap email content at MAX_EMAIL_CHARS so a runaway HTML email can't force
+    minutes of prompt prefill. Truncation is marked so the model knows the
+    text is cut off.
+    """
+    if len(email_content) > MAX_EMAIL_CHARS:
+        return email_content[:MAX_EMAIL_CHARS] + "\n[...truncated...]"
+    return email_content
+
+# Static summarization instruction. Keeping it in the system message (with
+# the email alone in the user turn) means every request shares the same
+# prompt prefix, letting Ollama reuse its KV cache instead of re-processing
+# the instruction tokens each time.
+SUMMARY_INSTRUCTION = """Please summarize the email you are given IN 40 WORDS OR LESS, concisely. The email might include html tags or other content. Do your best to interpret this, and provide only the summary without any leading text or explanation of what it is. I dont want an interpretation of the HTML, I was a summary of what a website with that HTML might be trying to tell me. LIMIT YOUR RESPONSE TO 40 WORDS. THIS IS CRITICAL."""
+
+# Static reply-generation rubric, shared across requests for the same reason.
+# The per-email fields stay in the user message.
+REPLY_INSTRUCTION = """Generate a professional and friendly reply to the email you are given. The reply should be contextual, addressing the main points or questions in the original email. Keep the tone professional but warm. Include a greeting and sign-off.
+
+Your reply should:
+1. Acknowledge the email
+2. Address the main points or questions
+3. Be concise (3-5 sentences)
+4. End with a professional sign-off using the name given as My Name"""
+
+# The system messages never change, so build them once instead of per request
+SUMMARY_SYSTEM_MESSAGE = SystemMessage(content=SUMMARY_INSTRUCTION)
+REPLY_SYSTEM_MESSAGE = SystemMessage(content=REPLY_INSTRUCTION)
+
+# Template for the per-email part of the reply prompt
+REPLY_USER_TEMPLATE = """Original Email Subject: {email_subject}
+Original Email Content: {email_content}
+Original Email Sender: {sender}
+My Email Address: {user_email}
+My Name: {user_name}
+Recipient Name: {sender_name}
+Recipient Email: {recipient_email}"""
+
+# Build the chat messages for email summarization
+def build_summary_messages(email_content):
+    """
+    Build the summarization messages for the given email content.
+    """
+    return [
+        SUMMARY_SYSTEM_MESSAGE,
+        HumanMessage(content=email_content),
+    ]
+
+# Flatten chat messages into a stable string for cache keying
+def messages_cache_text(messages):
+    """
+    Flatten chat messages into a deterministic string to hash as a cache key.
+    """
+    return "\n".join(f"{message.type}: {message.content}" for message in messages)
+
+# Precompiled patterns for pulling display names out of address fields
+_SENDER_NAME_RE = re.compile(r'^\s*([^<]*?)\s*(?:<|$)')
+_USER_NAME_RE = re.compile(r'^([^@]+)@')
+
+# Extract display names from the reply request fields
+def extract_names(sender, user_email, recipient_name):
+    """
+    Work out the name to greet the recipient with and the name to sign off
+    with, from the raw request fields.
+
+    Returns:
+        tuple: (sender_name, user_name)
+    """
+    sender_name = recipient_name or ""
+    if not sender_name and sender:
+        name_match = _SENDER_NAME_RE.match(sender)
+        if name_match and name_match.group(1):
+            sender_name = name_match.group(1)
+
+    user_name = "Me"
+    if user_email:
+        user_name_match = _USER_NAME_RE.match(user_email)
+        if user_name_match:
+            user_name = user_name_match.group(1).capitalize()
+
+    return sender_name, user_name
+
+# Build the chat messages for reply generation
+def build_reply_messages(email_content, email_subject, sender, user_email, sender_name, recipient_email, user_name):
+    """
+    Build the reply-generation messages from the email and the extracted names.
+    """
+    user_content = REPLY_USER_TEMPLATE.format_map({
+        'email_subject': email_subject,
+        'email_content': email_content,
+        'sender': sender,
+        'user_email': user_email,
+        'user_name': user_name,
+        'sender_name': sender_name,
+        'recipient_email': recipient_email,
+    })
+
+    return [
+        REPLY_SYSTEM_MESSAGE,
+        HumanMessage(content=user_content),
+    ]
+
+# Tokens that indicate the model already produced a greeting or sign-off
+GREETINGS = ("Hi", "Hello", "Dear")
+SIGNOFFS = ("regards", "sincerely", "best")
+
+# Apply greeting/sign-off fixups to a generated reply
+def finalize_reply(reply, greeting, user_name):
+    """
+    Make sure a generated reply has a greeting and a sign-off, adding them
+    when the model left them out.
+    """
+    if not reply.startswith(GREETINGS):
+        reply = f"{greeting}\n\n{reply}"
+
+    reply_lower = reply.lower()
+    if not any(signoff in reply_lower for signoff in SIGNOFFS):
+        reply = f"{reply}\n\nBest regards,\n{user_name}"
+
+    return reply
 
 @app.route('/summarize-email', methods=['POST'])
 def summarize_email():
     """
     Endpoint to summarize an email using the Llama 3.2 1B model via Ollama.
     """
-    data = request.json
+    data = request.get_json(force=True, silent=True, cache=True) or {}
     
     if not data or 'content' not in data:
-        return jsonify({'error': 'No email content provided'}), 400
+        return err('No email content provided', 400)
     
-    email_content = data['content']
-    model_name = data.get('model', 'llama3.2:1b')  # Explicitly use llama3.2:1b
+    email_content = truncate_email_content(data['content'])
+    model_name = data.get('model', DEFAULT_MODEL)
     
     # Check Ollama status
     ollama_running, ollama_error = check_ollama()
     if not ollama_running:
-        return jsonify({'error': ollama_error}), 503  # Service Unavailable
+        return err(ollama_error, 503)  # Service Unavailable
     
     try:
-        llm = Ollama(model=model_name)
-        
-        # Create a prompt specifically for email summarization
-        prompt = f"""Please summarize the following email IN 40 WORDS OR LESS, concisely. The email might include html tags or other content. Do your best to interpret this, and provide only the summary without any leading text or explanation of what it is. I dont want an interpretation of the HTML, I was a summary of what a website with that HTML might be trying to tell me. LIMIT YOUR RESPONSE TO 40 WORDS. THIS IS CRITICAL.:
+        # Create the messages specifically for email summarization
+        messages = build_summary_messages(email_content)
 
-{email_content}
+        # Return a cached summary if we've already summarized this email
+        cache_key, cached_summary = llm_cache_get(model_name, messages_cache_text(messages))
+        if cached_summary is not None:
+            return jsonify({'summary': cached_summary}), 200
+
+        llm = get_llm(model_name)
 
-Summary:"""         
-        
         # Generate the summary
-        response = llm.invoke(prompt)
-        summary = response.strip()
-        
+        response = llm.invoke(messages)
+        summary = response.content.strip()
+        llm_cache_put(cache_key, summary)
+
         # Return the summary
         return jsonify({'summary': summary}), 200
         
@@ -114,82 +383,52 @@ Summary:"""
         
         # Check if it's a connection error
         if "Connection refused" in error_msg:
-            return jsonify({'error': 'Cannot connect to Ollama. Please make sure Ollama is running'}), 503
+            return err('Cannot connect to Ollama. Please make sure Ollama is running', 503)
             
-        return jsonify({'error': f'Error summarizing email: {error_msg}'}), 500
+        return err(f'Error summarizing email: {error_msg}', 500)
 
 @app.route('/generate-reply', methods=['POST'])
 def generate_reply():
     """
     Endpoint to generate a contextual reply to an email using the Llama 3.2 1B model via Ollama.
     """
-    data = request.json
+    data = request.get_json(force=True, silent=True, cache=True) or {}
     
     if not data or 'emailContent' not in data:
-        return jsonify({'error': 'No email content provided'}), 400
+        return err('No email content provided', 400)
     
-    email_content = data['emailContent']
+    email_content = truncate_email_content(data['emailContent'])
     email_subject = data.get('emailSubject', '')
     sender = data.get('sender', '')
     user_email = data.get('userEmail', 'user@example.com')
     recipient_name = data.get('recipientName', '')
     recipient_email = data.get('recipientEmail', '')
-    model_name = data.get('model', 'llama3.2:1b')  # Explicitly use llama3.2:1b
+    model_name = data.get('model', DEFAULT_MODEL)
     
     # Check Ollama status
     ollama_running, ollama_error = check_ollama()
     if not ollama_running:
-        return jsonify({'error': ollama_error}), 503  # Service Unavailable
+        return err(ollama_error, 503)  # Service Unavailable
     
     try:
-        llm = Ollama(model=model_name)
-        
-        # Extract sender name if possible
-        sender_name = recipient_name or ""
-        if not sender_name and sender:
-            name_match = sender.split('<')[0].strip()
-            if name_match:
-                sender_name = name_match
-        
-        # Extract user name from email
-        user_name = "Me"
-        if user_email and '@' in user_email:
-            user_name_match = user_email.split('@')[0]
-            if user_name_match:
-                user_name = user_name_match.capitalize()
-        
+        # Extract names and create the messages specifically for email reply generation
+        sender_name, user_name = extract_names(sender, user_email, recipient_name)
         greeting = f"Hi {sender_name}," if sender_name else "Hello,"
-        
-        # Create a prompt specifically for email reply generation
-        prompt = f"""Generate a professional and friendly reply to the following email. The reply should be contextual, addressing the main points or questions in the original email. Keep the tone professional but warm. Include a greeting and sign-off.
+        messages = build_reply_messages(email_content, email_subject, sender, user_email, sender_name, recipient_email, user_name)
 
-Original Email Subject: {email_subject}
-Original Email Content: {email_content}
-Original Email Sender: {sender}
-My Email Address: {user_email}
-Recipient Name: {sender_name}
-Recipient Email: {recipient_email}
+        # Return a cached reply if we've already generated one for this email
+        cache_key, cached_reply = llm_cache_get(model_name, messages_cache_text(messages))
+        if cached_reply is not None:
+            return jsonify({'reply': cached_reply}), 200
 
-Your reply should:
-1. Acknowledge the email
-2. Address the main points or questions
-3. Be concise (3-5 sentences)
-4. End with a professional sign-off using my name ({user_name})
+        llm = get_llm(model_name)
+
+        # Generate the reply and add a greeting/sign-off if missing
+        response = llm.invoke(messages)
+        reply = finalize_reply(response.content.strip(), greeting, user_name)
+
+        llm_cache_put(cache_key, reply)
 
-Reply:"""
-        
-        # Generate the reply
-        response = llm.invoke(prompt)
-        reply = response.strip()
-        
-        # If the reply doesn't include a greeting, add one
-        if not reply.startswith("Hi") and not reply.startswith("Hello") and not reply.startswith("Dear"):
-            reply = f"{greeting}\n\n{reply}"
-            
-        # If the reply doesn't include a sign-off, add one
-        if not "regards" in reply.lower() and not "sincerely" in reply.lower() and not "best" in reply.lower():
-            reply = f"{reply}\n\nBest regards,\n{user_name}"
-        
         # Return the reply
         return jsonify({'reply': reply}), 200
         
@@ -198,9 +437,181 @@ Reply:"""
         
         # Check if it's a connection error
         if "Connection refused" in error_msg:
-            return jsonify({'error': 'Cannot connect to Ollama. Please make sure Ollama is running'}), 503
+            return err('Cannot connect to Ollama. Please make sure Ollama is running', 503)
             
-        return jsonify({'error': f'Error generating reply: {error_msg}'}), 500
+        return err(f'Error generating reply: {error_msg}', 500)
+
+@app.route('/summarize-emails-batch', methods=['POST'])
+def summarize_emails_batch():
+    """
+    Endpoint to summarize several emails in one request. The emails are
+    dispatched to the model concurrently (bounded by 'concurrency') and the
+    summaries are returned in input order, so summarizing a mailbox costs one
+    HTTP round-trip instead of N.
+    """
+    data = request.get_json(force=True, silent=True, cache=True) or {}
+
+    if not isinstance(data, dict) or not isinstance(data.get('emails'), list):
+        return err('No emails provided', 400)
+
+    emails = data['emails']
+    model_name = data.get('model', DEFAULT_MODEL)
+    try:
+        concurrency = max(1, min(int(data.get('concurrency', 8)), 16))
+    except (TypeError, ValueError):
+        return err('Invalid concurrency value', 400)
+
+    # Check Ollama status
+    ollama_running, ollama_error = check_ollama()
+    if not ollama_running:
+        return err(ollama_error, 503)
+
+    try:
+        llm = get_llm(model_name)
+
+        async def summarize_all():
+            sem = asyncio.Semaphore(concurrency)
+
+            async def summarize_one(email_content):
+                if not isinstance(email_content, str) or not email_content:
+                    return {'error': 'Invalid email content'}
+
+                messages = build_summary_messages(truncate_email_content(email_content))
+                cache_key, cached_summary = llm_cache_get(model_name, messages_cache_text(messages))
+                if cached_summary is not None:
+                    return {'summary': cached_summary}
+
+                async with sem:
+                    response = await llm.ainvoke(messages)
+
+                summary = response.content.strip()
+                llm_cache_put(cache_key, summary)
+                return {'summary': summary}
+
+            return await asyncio.gather(
+                *[summarize_one(email) for email in emails],
+                return_exceptions=True
+            )
+
+        results = asyncio.run(summarize_all())
+
+        summaries = []
+        for result in results:
+            if isinstance(result, Exception):
+                summaries.append({'error': f'Error summarizing email: {str(result)}'})
+            else:
+                summaries.append(result)
+
+        return jsonify({'summaries': summaries}), 200
+
+    except Exception as e:
+        error_msg = str(e)
+
+        # Check if it's a connection error
+        if "Connection refused" in error_msg:
+            return err('Cannot connect to Ollama. Please make sure Ollama is running', 503)
+
+        return err(f'Error summarizing emails: {error_msg}', 500)
+
+@app.route('/summarize-email-stream', methods=['POST'])
+def summarize_email_stream():
+    """
+    Streaming variant of /summarize-email. Emits Server-Sent Events with a
+    {'delta': token} payload per generated chunk, followed by a final
+    {'done': True, 'summary': ...} event, so clients can render the summary
+    as it is generated instead of waiting for the full response.
+    """
+    data = request.get_json(force=True, silent=True, cache=True) or {}
+
+    if not data or 'content' not in data:
+        return err('No email content provided', 400)
+
+    email_content = truncate_email_content(data['content'])
+    model_name = data.get('model', DEFAULT_MODEL)
+
+    # Check Ollama status
+    ollama_running, ollama_error = check_ollama()
+    if not ollama_running:
+        return err(ollama_error, 503)
+
+    messages = build_summary_messages(email_content)
+    cache_key, cached_summary = llm_cache_get(model_name, messages_cache_text(messages))
+
+    def gen():
+        try:
+            # A cache hit streams as a single delta
+            if cached_summary is not None:
+                yield f"data: {json.dumps({'delta': cached_summary})}\n\n"
+                yield f"data: {json.dumps({'done': True, 'summary': cached_summary})}\n\n"
+                return
+
+            llm = get_llm(model_name)
+            chunks = []
+            for chunk in llm.stream(messages):
+                chunks.append(chunk.content)
+                yield f"data: {json.dumps({'delta': chunk.content})}\n\n"
+
+            summary = ''.join(chunks).strip()
+            llm_cache_put(cache_key, summary)
+            yield f"data: {json.dumps({'done': True, 'summary': summary})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': f'Error summarizing email: {str(e)}'})}\n\n"
+
+    return Response(stream_with_context(gen()), mimetype='text/event-stream')
+
+@app.route('/generate-reply-stream', methods=['POST'])
+def generate_reply_stream():
+    """
+    Streaming variant of /generate-reply. Emits Server-Sent Events with a
+    {'delta': token} payload per generated chunk, followed by a final
+    {'done': True, 'reply': ...} event carrying the full reply with the
+    greeting/sign-off fixups applied (a missing greeting can only be
+    prepended once generation has finished).
+    """
+    data = request.get_json(force=True, silent=True, cache=True) or {}
+
+    if not data or 'emailContent' not in data:
+        return err('No email content provided', 400)
+
+    email_content = truncate_email_content(data['emailContent'])
+    email_subject = data.get('emailSubject', '')
+    sender = data.get('sender', '')
+    user_email = data.get('userEmail', 'user@example.com')
+    recipient_name = data.get('recipientName', '')
+    recipient_email = data.get('recipientEmail', '')
+    model_name = data.get('model', DEFAULT_MODEL)
+
+    # Check Ollama status
+    ollama_running, ollama_error = check_ollama()
+    if not ollama_running:
+        return err(ollama_error, 503)
+
+    sender_name, user_name = extract_names(sender, user_email, recipient_name)
+    greeting = f"Hi {sender_name}," if sender_name else "Hello,"
+    messages = build_reply_messages(email_content, email_subject, sender, user_email, sender_name, recipient_email, user_name)
+    cache_key, cached_reply = llm_cache_get(model_name, messages_cache_text(messages))
+
+    def gen():
+        try:
+            # A cache hit streams as a single delta
+            if cached_reply is not None:
+                yield f"data: {json.dumps({'delta': cached_reply})}\n\n"
+                yield f"data: {json.dumps({'done': True, 'reply': cached_reply})}\n\n"
+                return
+
+            llm = get_llm(model_name)
+            chunks = []
+            for chunk in llm.stream(messages):
+                chunks.append(chunk.content)
+                yield f"data: {json.dumps({'delta': chunk.content})}\n\n"
+
+            reply = finalize_reply(''.join(chunks).strip(), greeting, user_name)
+            llm_cache_put(cache_key, reply)
+            yield f"data: {json.dumps({'done': True, 'reply': reply})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': f'Error generating reply: {str(e)}'})}\n\n"
+
+    return Response(stream_with_context(gen()), mimetype='text/event-stream')
 
 @app.route('/', methods=['GET'])
 def health_check():
@@ -234,7 +645,7 @@ def ollama_status():
     if ollama_running:
         return jsonify({
             'status': 'ok',
-            'message': 'Ollama is running and Llama 3.2 1B model is available'
+            'message': f'Ollama is running and the {DEFAULT_MODEL} model is available'
         })
     else:
         return jsonify({
@@ -247,4 +658,8 @@ if __name__ == "__main__":
     parser.add_argument('--port', type=int, default=5001, help='Port to run the server on')
     args = parser.parse_args()
     
-    app.run(debug=True, host='0.0.0.0', port=args.port) 
\ No newline at end of file
+    # Dev entry point. threaded=True lets slow LLM calls overlap instead of
+    # serializing every request; use start_server.sh (gunicorn) in production.
+    # The reloader/debugger cost CPU per request, so they're opt-in.
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    app.run(debug=debug, host='0.0.0.0', port=args.port, threaded=True)
\ No newline at end of file
@@ -9,6 +9,13 @@ if [ -d "venv" ]; then
     source venv/bin/activate
 fi
 
-# Start the Flask server
-echo "Starting Flask server..."
-python3 app.py 
\ No newline at end of file
+# Start the Flask server. Prefer gunicorn with threaded workers so
+# concurrent requests overlap instead of queueing behind a single LLM
+# call; fall back to the dev server if gunicorn isn't installed.
+if command -v gunicorn > /dev/null 2>&1; then
+    echo "Starting Flask server (gunicorn)..."
+    exec gunicorn -k gthread -w 2 --threads 16 -b 0.0.0.0:5001 app:app
+else
+    echo "gunicorn not found, starting Flask dev server..."
+    python3 app.py
+fi 
\ No newline at end of file